@@ -0,0 +1,85 @@
+import hashlib
+import os
+
+from tools import generate_games as generator
+
+
+def _write_pgn(path, moves: str, mtime_ns: int) -> None:
+    path.write_text(f'[Event "LcStudy Training Game"]\n\n{moves} *\n')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_existing_move_keys_reuse_cache_until_file_changes(tmp_path, monkeypatch) -> None:
+    pgn_dir = tmp_path / "pgn"
+    pgn_dir.mkdir()
+    cache_path = tmp_path / "cache" / "move-keys.pkl"
+    _write_pgn(pgn_dir / "a.pgn", "1. e4 e5", 1_000_000_000)
+    (pgn_dir / "broken.pgn.gz").write_bytes(b"not gzip")
+
+    expected = hashlib.sha256(b"e2e4 e7e5").hexdigest()
+    assert generator.load_existing_move_keys(pgn_dir, cache_path) == {expected}
+    assert cache_path.exists()
+
+    def fail(pgn):
+        raise AssertionError("cached PGN should not be re-parsed")
+
+    monkeypatch.setattr(generator, "move_sequence_key", fail)
+    assert generator.load_existing_move_keys(pgn_dir, cache_path) == {expected}
+    monkeypatch.undo()
+
+    _write_pgn(pgn_dir / "a.pgn", "1. d4 d5", 2_000_000_000)
+    changed = hashlib.sha256(b"d2d4 d7d5").hexdigest()
+    assert generator.load_existing_move_keys(pgn_dir, cache_path) == {changed}
+
+
+def test_existing_move_keys_tolerate_corrupt_cache(tmp_path) -> None:
+    pgn_dir = tmp_path / "pgn"
+    pgn_dir.mkdir()
+    cache_path = tmp_path / "move-keys.pkl"
+    cache_path.write_bytes(b"not a pickle")
+    _write_pgn(pgn_dir / "a.pgn", "1. e4 e5", 1_000_000_000)
+
+    keys = generator.load_existing_move_keys(pgn_dir, cache_path)
+
+    assert keys == {hashlib.sha256(b"e2e4 e7e5").hexdigest()}
+    assert generator.read_move_key_cache(cache_path)
+
+
+def test_existing_move_keys_reparse_unrecognized_cache_entries(tmp_path) -> None:
+    pgn_dir = tmp_path / "pgn"
+    pgn_dir.mkdir()
+    cache_path = tmp_path / "move-keys.pkl"
+    _write_pgn(pgn_dir / "a.pgn", "1. e4 e5", 1_000_000_000)
+    generator.write_move_key_cache(
+        cache_path, {str(pgn_dir.resolve()): {"a.pgn": {"key": "stale"}}}
+    )
+
+    keys = generator.load_existing_move_keys(pgn_dir, cache_path)
+
+    assert keys == {hashlib.sha256(b"e2e4 e7e5").hexdigest()}
+    assert list(cache_path.parent.glob("*.tmp")) == []
+
+
+def test_existing_move_keys_parallel_parse_matches_serial(tmp_path, monkeypatch) -> None:
+    pgn_dir = tmp_path / "pgn"
+    pgn_dir.mkdir()
+    _write_pgn(pgn_dir / "a.pgn", "1. e4 e5", 1_000_000_000)
+    _write_pgn(pgn_dir / "b.pgn", "1. d4 d5", 1_000_000_000)
+    (pgn_dir / "broken.pgn.gz").write_bytes(b"not gzip")
+
+    serial_cache = tmp_path / "serial.pkl"
+    serial = generator.load_existing_move_keys(pgn_dir, serial_cache)
+
+    monkeypatch.setattr(generator, "PARALLEL_PARSE_MIN_FILES", 1)
+    parallel_cache = tmp_path / "parallel.pkl"
+    parallel = generator.load_existing_move_keys(pgn_dir, parallel_cache)
+
+    assert parallel == serial == {
+        hashlib.sha256(b"e2e4 e7e5").hexdigest(),
+        hashlib.sha256(b"d2d4 d7d5").hexdigest(),
+    }
+    assert generator.read_move_key_cache(parallel_cache) == generator.read_move_key_cache(
+        serial_cache
+    )
+    cached = generator.read_move_key_cache(parallel_cache)[str(pgn_dir.resolve())]
+    assert "broken.pgn.gz" not in cached
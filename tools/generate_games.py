@@ -16,17 +16,21 @@ You'll also need:
 
 import argparse
 import base64
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import gzip
 import hashlib
 import io
 import json
 import math
+import os
+import pickle
 import random
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional
@@ -46,6 +50,9 @@ except ImportError:
 NETS_DIR = Path.home() / ".lcstudy" / "nets"
 OUTPUT_DIR = Path(__file__).parent.parent / "src" / "lcstudy" / "data" / "pgn"
 APPLE_SILICON_CONFIG = Path(__file__).parent / "lc0-apple-silicon.config"
+MOVE_KEY_CACHE = Path.home() / ".lcstudy" / "cache" / "move-keys.pkl"
+# Below this many uncached PGNs, worker process start-up costs more than it saves.
+PARALLEL_PARSE_MIN_FILES = 64
 
 MAIA_LEVELS = list(range(1100, 2000, 100)) + [2200]
 
@@ -57,6 +64,15 @@ MAX_PLIES = 300
 # Partial-credit decay: win% loss (vs the played move) that costs a factor e.
 GRADING_TAU = 10.0
 
+# lc0 VerboseMoveStats lines, e.g.
+#   info string e2e4  (322 ) N: 45 (+ 3) (P: 12.34%) ... (Q: 0.04567) ... (V: 0.0456)
+VERBOSE_MOVE_RE = re.compile(r"info string\s+([a-h][1-8][a-h][1-8][qrbn]?)\s+\(")
+VERBOSE_POLICY_RE = re.compile(r"\(P:\s*([0-9.]+)%\)")
+VERBOSE_VISITS_RE = re.compile(r"N:\s*(\d+)")
+VERBOSE_Q_RE = re.compile(r"\(Q:\s*(-?[0-9.]+)\)")
+VERBOSE_V_RE = re.compile(r"\(V:\s*(-?[0-9.]+)\)")
+BESTMOVE_RE = re.compile(r"bestmove\s+(\S+)")
+
 
 # =============================================================================
 # UCI Engine (Direct subprocess, no python-chess engine module)
@@ -149,7 +165,7 @@ class UciEngine:
             if line == "" and self.proc.poll() is not None:
                 raise RuntimeError("lc0 exited before bestmove")
             if line.startswith("bestmove"):
-                match = re.match(r"bestmove\s+(\S+)", line)
+                match = BESTMOVE_RE.match(line)
                 if match:
                     return chess.Move.from_uci(match.group(1))
                 raise ValueError(f"Could not parse bestmove: {line}")
@@ -186,13 +202,13 @@ class UciEngine:
             if line == "" and self.proc.poll() is not None:
                 raise RuntimeError(f"lc0 exited before policy analysis completed for {board.fen()}")
 
-            if line.startswith("info string"):
-                move_match = re.match(r"info string\s+([a-h][1-8][a-h][1-8][qrbn]?)\s+\(", line)
-                policy_match = re.search(r"\(P:\s*([0-9.]+)%\)", line)
-                visits_match = re.search(r"N:\s*(\d+)", line)
-                q_match = re.search(r"\(Q:\s*(-?[0-9.]+)\)", line)
-                v_match = re.search(r"\(V:\s*(-?[0-9.]+)\)", line)
-                if move_match and policy_match:
+            move_match = VERBOSE_MOVE_RE.match(line)
+            if move_match:
+                policy_match = VERBOSE_POLICY_RE.search(line)
+                visits_match = VERBOSE_VISITS_RE.search(line)
+                q_match = VERBOSE_Q_RE.search(line)
+                v_match = VERBOSE_V_RE.search(line)
+                if policy_match:
                     move_uci = normalize_engine_uci(move_match.group(1), legal_uci)
                     if move_uci in legal_uci:
                         stats_by_move[move_uci] = {
@@ -203,7 +219,7 @@ class UciEngine:
                         }
 
             if line.startswith("bestmove"):
-                match = re.match(r"bestmove\s+(\S+)", line)
+                match = BESTMOVE_RE.match(line)
                 if match:
                     best_move = chess.Move.from_uci(match.group(1))
                     break
@@ -337,17 +353,26 @@ def build_graded_analysis(
     played_uci: str,
 ) -> list[dict[str, object]]:
     """Build the v2 per-move analysis list with Q-based partial credit."""
-    total_visits = sum(int(s["n"]) for s in stats_by_move.values()) or 1
-
-    qs = [effective_q(s) for s in stats_by_move.values()]
-    worst_wp = min((win_pct(q, 0.0) for q in qs if q is not None), default=0.0)
-    played_wp = win_pct(effective_q(stats_by_move[played_uci]), 50.0)
+    total_visits = 0
+    worst_wp: Optional[float] = None
+    qs: dict[str, Optional[float]] = {}
+    for uci, stats in stats_by_move.items():
+        total_visits += int(stats["n"])
+        q = qs[uci] = effective_q(stats)
+        if q is not None:
+            wp = win_pct(q, 0.0)
+            if worst_wp is None or wp < worst_wp:
+                worst_wp = wp
+    total_visits = total_visits or 1
+    if worst_wp is None:
+        worst_wp = 0.0
+    played_wp = win_pct(qs[played_uci], 50.0)
 
     analysis = []
     for move in board.legal_moves:
         uci = move.uci()
         stats = stats_by_move[uci]
-        q = effective_q(stats)
+        q = qs[uci]
         wp = win_pct(q, worst_wp)  # unevaluated moves grade like the worst known move
         loss = max(0.0, played_wp - wp)
         accuracy = 100.0 if uci == played_uci else 100.0 * math.exp(-loss / GRADING_TAU)
@@ -381,12 +406,7 @@ def move_sequence_key(pgn: str) -> str:
     game = chess.pgn.read_game(io.StringIO(pgn))
     if game is None:
         raise ValueError("Could not parse generated PGN")
-    board = game.board()
-    moves = []
-    for move in game.mainline_moves():
-        moves.append(move.uci())
-        board.push(move)
-    raw = " ".join(moves).encode("utf-8")
+    raw = " ".join(move.uci() for move in game.mainline_moves()).encode("utf-8")
     return hashlib.sha256(raw).hexdigest()
 
 
@@ -400,16 +420,102 @@ def read_pgn_text(path: Path) -> str:
 
 def iter_pgn_paths(directory: Path) -> list[Path]:
     """All PGN files in a directory, compressed or not, sorted by name."""
-    return sorted(list(directory.glob("*.pgn")) + list(directory.glob("*.pgn.gz")))
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith((".pgn", ".pgn.gz"))
+        )
 
 
-def load_existing_move_keys(output_dir: Path) -> set[str]:
-    keys: set[str] = set()
+def read_move_key_cache(cache_path: Path) -> dict[str, dict[str, tuple[int, int, str]]]:
+    """Cached move keys: {directory: {filename: (mtime_ns, size, key)}}."""
+    try:
+        with open(cache_path, "rb") as fh:
+            payload = pickle.load(fh)
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def write_move_key_cache(
+    cache_path: Path,
+    payload: dict[str, dict[str, tuple[int, int, str]]],
+) -> None:
+    temporary: Optional[Path] = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # A per-writer temp file keeps concurrent runs from sharing one inode.
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent,
+            prefix=f".{cache_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as fh:
+            temporary = Path(fh.name)
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    except OSError:
+        # The cache only saves re-parsing; never fail generation over it.
+        if temporary is not None:
+            temporary.unlink(missing_ok=True)
+
+
+def move_key_for_path(path: Path) -> Optional[str]:
+    try:
+        return move_sequence_key(read_pgn_text(path))
+    except Exception:
+        return None
+
+
+def load_existing_move_keys(
+    output_dir: Path,
+    cache_path: Optional[Path] = MOVE_KEY_CACHE,
+) -> set[str]:
+    """Move keys of every PGN in output_dir, re-parsing only changed files.
+
+    Keys are cached per file by (mtime_ns, size) so repeat runs over the
+    corpus skip PGN parsing entirely. Pass cache_path=None to disable.
+    """
+    payload = read_move_key_cache(cache_path) if cache_path is not None else {}
+    directory = str(output_dir.resolve())
+    cached = payload.get(directory)
+    if not isinstance(cached, dict):
+        cached = {}
+
+    entries: dict[str, tuple[int, int, str]] = {}
+    misses: list[tuple[Path, os.stat_result]] = []
     for path in iter_pgn_paths(output_dir):
         try:
-            keys.add(move_sequence_key(read_pgn_text(path)))
-        except Exception:
+            stat = path.stat()
+        except OSError:
             continue
+        entry = cached.get(path.name)
+        if (
+            not isinstance(entry, tuple)
+            or len(entry) != 3
+            or entry[:2] != (stat.st_mtime_ns, stat.st_size)
+        ):
+            misses.append((path, stat))
+        else:
+            entries[path.name] = entry
+
+    # PGN parsing is CPU-bound Python, so fan a cold corpus out to processes.
+    miss_paths = [path for path, _ in misses]
+    if len(misses) >= PARALLEL_PARSE_MIN_FILES:
+        with ProcessPoolExecutor() as pool:
+            miss_keys = list(pool.map(move_key_for_path, miss_paths, chunksize=32))
+    else:
+        miss_keys = [move_key_for_path(path) for path in miss_paths]
+    for (path, stat), key in zip(misses, miss_keys):
+        if key is not None:
+            entries[path.name] = (stat.st_mtime_ns, stat.st_size, key)
+
+    keys = {entry[2] for entry in entries.values()}
+
+    if cache_path is not None and entries != cached:
+        payload[directory] = entries
+        write_move_key_cache(cache_path, payload)
     return keys
 
 
@@ -634,10 +740,11 @@ def main():
     if not maia_specs:
         print(f"Error: No Maia networks in {NETS_DIR}")
         return 1
+    maia_nets = {spec.level: find_network(f"maia-{spec.level}") for spec in maia_specs}
     print(f"  Maia: {[spec.label() for spec in maia_specs]}")
 
     args.output.mkdir(parents=True, exist_ok=True)
-    existing = len(list(args.output.glob("*.pgn")))
+    existing = len(iter_pgn_paths(args.output))
     print(f"  Output: {args.output.name}/ ({existing} existing)")
     print(f"  Leela search: {leela_budget.label()}/move")
     print(f"  Maia search: {[spec.label() for spec in maia_specs]}")
@@ -670,7 +777,7 @@ def main():
     while success < args.count and attempts < max_attempts:
         attempts += 1
         maia_spec = random.choice(maia_specs)
-        maia_net = find_network(f"maia-{maia_spec.level}")
+        maia_net = maia_nets[maia_spec.level]
         maia_budget = SearchBudget(nodes=maia_spec.nodes)
         maia_temperature = (
             args.maia_temperature_random_min
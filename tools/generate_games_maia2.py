@@ -480,6 +480,7 @@ def main():
 
     lock = threading.Lock()
     state = {
+        "reserved": 0,
         "success": 0,
         "attempts": 0,
         "plies": 0,
@@ -493,7 +494,7 @@ def main():
         while True:
             with lock:
                 if (
-                    state["success"] >= args.count
+                    state["reserved"] >= args.count
                     or state["attempts"] >= max_attempts
                     or state["fatal_error"] is not None
                 ):
@@ -527,29 +528,35 @@ def main():
                 continue
 
             key = move_sequence_key(pgn)
+            # Claim the line and a file number under the lock; compress and
+            # write outside it so other workers are not stalled on disk I/O.
             with lock:
                 if key in move_keys:
                     print("[SKIP] duplicate line", flush=True)
                     continue
-                if state["success"] >= args.count:
+                if state["reserved"] >= args.count:
                     return
-                n = state["success"] + 1
-                fname = f"{batch_id}_{n:04d}.pgn.gz"
-                output_path = args.output / fname
-                temporary_path = output_path.with_suffix(output_path.suffix + ".tmp")
-                try:
-                    with gzip.open(temporary_path, "wt", encoding="utf-8") as fh:
-                        fh.write(pgn + "\n")
-                    os.replace(temporary_path, output_path)
-                except OSError as exc:
-                    temporary_path.unlink(missing_ok=True)
+                state["reserved"] += 1
+                move_keys.add(key)
+                fname = f"{batch_id}_{state['reserved']:04d}.pgn.gz"
+
+            output_path = args.output / fname
+            temporary_path = output_path.with_suffix(output_path.suffix + ".tmp")
+            try:
+                with gzip.open(temporary_path, "wt", encoding="utf-8") as fh:
+                    fh.write(pgn + "\n")
+                os.replace(temporary_path, output_path)
+            except OSError as exc:
+                temporary_path.unlink(missing_ok=True)
+                with lock:
                     state["fatal_error"] = f"Could not save {fname}: {exc}"
                     print(f"[FATAL] {state['fatal_error']}", flush=True)
-                    return
+                return
 
-                move_keys.add(key)
-                state["success"] = n
+            with lock:
+                state["success"] += 1
                 state["plies"] += plies
+                n = state["success"]
 
                 if n % 25 == 0 or n == args.count:
                     elapsed = time.time() - state["start"]
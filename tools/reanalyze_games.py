@@ -29,7 +29,7 @@ import base64
 import gzip
 import io
 import json
-import math
+import os
 import re
 import subprocess
 import sys
@@ -46,11 +46,25 @@ except ImportError:
     print("Missing dependency. Install with: pip install chess")
     sys.exit(1)
 
-NETS_DIR = Path.home() / ".lcstudy" / "nets"
-PGN_DIR = Path(__file__).parent.parent / "src" / "lcstudy" / "data" / "pgn"
-APPLE_SILICON_CONFIG = Path(__file__).parent / "lc0-apple-silicon.config"
+sys.path.insert(0, str(Path(__file__).parent))
+from generate_games import (  # noqa: E402
+    APPLE_SILICON_CONFIG,
+    GRADING_TAU,
+    NETS_DIR,
+    VERBOSE_MOVE_RE,
+    VERBOSE_POLICY_RE,
+    VERBOSE_Q_RE,
+    VERBOSE_V_RE,
+    VERBOSE_VISITS_RE,
+    build_graded_analysis,
+    find_lc0,
+    find_network,
+    iter_pgn_paths,
+    normalize_engine_uci,
+    read_pgn_text,
+)
 
-TAU = 10.0  # win% loss that costs a factor e of partial credit
+PGN_DIR = Path(__file__).parent.parent / "src" / "lcstudy" / "data" / "pgn"
 
 _print_lock = threading.Lock()
 
@@ -60,20 +74,6 @@ def log(msg: str):
         print(msg, flush=True)
 
 
-def find_lc0() -> str:
-    for path in [
-        Path.home() / ".lcstudy" / "bin" / "lc0",
-        Path("/opt/homebrew/bin/lc0"),
-        Path("/usr/local/bin/lc0"),
-    ]:
-        if path.exists():
-            return str(path)
-    result = subprocess.run(["which", "lc0"], capture_output=True, text=True)
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
-    raise FileNotFoundError("lc0 not found")
-
-
 def decode_blob(comment: str) -> Optional[dict]:
     m = re.search(r"\[%lcstudy\s+([A-Za-z0-9_-]+)\]", comment)
     if not m:
@@ -89,16 +89,6 @@ def encode_blob(payload: dict) -> str:
     return f"[%lcstudy {encoded}]"
 
 
-def normalize_engine_uci(raw_uci: str, legal_uci: set) -> str:
-    if raw_uci in legal_uci:
-        return raw_uci
-    castle_map = {"e1h1": "e1g1", "e1a1": "e1c1", "e8h8": "e8g8", "e8a8": "e8c8"}
-    castled = castle_map.get(raw_uci)
-    if castled in legal_uci:
-        return castled
-    return raw_uci
-
-
 class UciEngine:
     """Synchronous UCI wrapper collecting verbose move stats (P, N, Q, V)."""
 
@@ -146,13 +136,13 @@ class UciEngine:
         while True:
             line = self._readline()
 
-            if line.startswith("info string"):
-                mv = re.match(r"info string\s+([a-h][1-8][a-h][1-8][qrbn]?)\s", line)
-                p_m = re.search(r"\(P:\s*([0-9.]+)%\)", line)
-                n_m = re.search(r"N:\s*(\d+)", line)
-                q_m = re.search(r"\(Q:\s*(-?[0-9.]+)\)", line)
-                v_m = re.search(r"\(V:\s*(-?[0-9.]+)\)", line)
-                if mv and p_m:
+            mv = VERBOSE_MOVE_RE.match(line)
+            if mv:
+                p_m = VERBOSE_POLICY_RE.search(line)
+                n_m = VERBOSE_VISITS_RE.search(line)
+                q_m = VERBOSE_Q_RE.search(line)
+                v_m = VERBOSE_V_RE.search(line)
+                if p_m:
                     uci = normalize_engine_uci(mv.group(1), legal_uci)
                     if uci in legal_uci:
                         stats[uci] = {
@@ -178,60 +168,28 @@ class UciEngine:
             self.proc.kill()
 
 
-def effective_q(stats: dict) -> Optional[float]:
-    """Search Q for visited moves; net value estimate V otherwise."""
-    if stats["n"] > 0 and stats["q"] is not None:
-        return stats["q"]
-    return stats["v"]
-
-
-def win_pct(q: Optional[float], fallback: float) -> float:
-    if q is None:
-        return fallback
-    return 50.0 + 50.0 * max(-1.0, min(1.0, q))
-
-
 def build_v2_analysis(board: chess.Board, stats: dict, played_uci: str, nodes: int) -> dict:
-    total_visits = sum(s["n"] for s in stats.values()) or 1
-
-    qs = [effective_q(s) for s in stats.values()]
-    worst_wp = min((win_pct(q, 0.0) for q in qs if q is not None), default=0.0)
-    played_wp = win_pct(effective_q(stats[played_uci]), 50.0)
-
-    moves = []
-    for move in board.legal_moves:
-        uci = move.uci()
-        s = stats[uci]
-        q = effective_q(s)
-        wp = win_pct(q, worst_wp)  # unevaluated moves grade like the worst known move
-        loss = max(0.0, played_wp - wp)
-        a = 100.0 if uci == played_uci else 100.0 * math.exp(-loss / TAU)
-        moves.append({
-            "u": uci,
-            "s": board.san(move),
-            "p": round(s["p"], 2),
-            "n": round(100.0 * s["n"] / total_visits, 2),
-            "q": round(q, 4) if q is not None else None,
-            "a": round(a, 2),
-        })
-
-    moves.sort(key=lambda item: item["a"], reverse=True)
+    moves = build_graded_analysis(board, stats, played_uci)
     return {"v": 2, "best": played_uci, "nodes": nodes, "moves": moves}
 
 
-def read_pgn_text(path: Path) -> str:
-    if str(path).endswith(".gz"):
-        with gzip.open(path, "rt", encoding="utf-8") as fh:
-            return fh.read()
-    return path.read_text()
-
-
 def write_pgn_text(path: Path, text: str):
-    if str(path).endswith(".gz"):
-        with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as fh:
-            fh.write(text)
-    else:
-        path.write_text(text)
+    """Replace a PGN atomically so an interrupted run never truncates the corpus."""
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    data = text.encode("utf-8")
+    try:
+        with open(temporary, "wb") as raw:
+            if str(path).endswith(".gz"):
+                with gzip.GzipFile(filename=path.name, mode="wb", compresslevel=9, fileobj=raw) as fh:
+                    fh.write(data)
+            else:
+                raw.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
 
 
 def reanalyze_file(path: Path, engine: UciEngine, nodes: int) -> tuple[bool, int]:
@@ -257,7 +215,7 @@ def reanalyze_file(path: Path, engine: UciEngine, nodes: int) -> tuple[bool, int
         history.append(node.move.uci())
 
     if changed:
-        game.headers["LcStudyGrading"] = f"q-wpl-exp{TAU:g}@{nodes}n"
+        game.headers["LcStudyGrading"] = f"q-wpl-exp{GRADING_TAU:g}@{nodes}n"
         exporter = chess.pgn.StringExporter(headers=True, variations=False, comments=True)
         write_pgn_text(path, game.accept(exporter) + "\n")
 
@@ -315,17 +273,13 @@ def main():
     parser.add_argument("--workers", type=int, default=3)
     args = parser.parse_args()
 
-    weights = None
-    for ext in (".pb.gz", ".pb"):
-        candidate = NETS_DIR / f"{args.leela_net}{ext}"
-        if candidate.exists():
-            weights = candidate
-            break
-    if weights is None:
+    try:
+        weights = find_network(args.leela_net)
+    except FileNotFoundError:
         print(f"Error: net {args.leela_net} not found in {NETS_DIR}")
         return 1
 
-    files = sorted(list(args.dir.glob("*.pgn")) + list(args.dir.glob("*.pgn.gz")))
+    files = iter_pgn_paths(args.dir)
     if args.limit:
         files = files[: args.limit]
 